@@ -0,0 +1,523 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Générateur de données synthétiques pour le schéma RGPD (exercice 1)
+Description: Remplit rgpd_production.clients/factures (et optionnellement
+rgpd_archive) avec un volume configurable de lignes réalistes, pour évaluer
+l'anonymisation, la purge et les rapports à l'échelle de la production.
+
+Cibles :
+  - mysql  : fichiers TSV chargés via LOAD DATA LOCAL INFILE
+  - sqlite : base locale alimentée par insertions groupées (executemany)
+"""
+
+import argparse
+import datetime
+import hashlib
+import itertools
+import os
+import random
+import secrets
+import sqlite3
+import subprocess
+import sys
+import time
+
+# Configuration
+DB_USER = os.environ.get('RGPD_DB_USER', 'rgpd_user')
+DB_PASS = os.environ.get('RGPD_DB_PASS', 'rgpd_secure_password_2025!')
+DB_PROD = 'rgpd_production'
+DB_ARCHIVE = 'rgpd_archive'
+
+# Tranches de conservation (en années calendaires avant la date de référence)
+# - actifs     : dernière commande < 3 ans
+# - anonymiser : dernière commande entre 3 et 10 ans
+# - supprimer  : dernière commande > 10 ans
+BANDS = {
+    'actifs': (0, 3),
+    'anonymiser': (3, 10),
+    'supprimer': (10, 15),
+}
+
+# Villes reconnues par anonymize_address() et pondération (part de la clientèle)
+CITIES = [
+    ('Paris', 'ILE_FR', 30),
+    ('Lyon', 'RHONE_ALPES', 15),
+    ('Marseille', 'PACA', 12),
+    ('Aix-en-Provence', 'PACA', 4),
+    ('Toulouse', 'OCCITANIE', 10),
+    ('Bordeaux', 'AUTRE', 8),
+    ('Lille', 'AUTRE', 7),
+    ('Nantes', 'AUTRE', 7),
+    ('Strasbourg', 'AUTRE', 7),
+]
+
+NOMS = [
+    'Martin', 'Bernard', 'Dubois', 'Thomas', 'Robert', 'Richard', 'Petit',
+    'Durand', 'Leroy', 'Moreau', 'Simon', 'Laurent', 'Lefebvre', 'Michel',
+    'Garcia', 'David', 'Bertrand', 'Roux', 'Vincent', 'Fournier', 'Morel',
+    'Girard', 'Andre', 'Mercier', 'Dupont', 'Lambert', 'Bonnet', 'Francois',
+    'Martinez', 'Legrand', 'Garnier', 'Faure', 'Rousseau', 'Blanc', 'Guerin',
+]
+
+PRENOMS = [
+    'Pierre', 'Marie', 'Jean', 'Sophie', 'Thomas', 'Claire', 'Paul', 'Emma',
+    'Michel', 'Isabelle', 'Nicolas', 'Julie', 'Lucas', 'Camille', 'Hugo',
+    'Lea', 'Louis', 'Chloe', 'Antoine', 'Manon', 'Julien', 'Sarah', 'Elena',
+    'James', 'Alice', 'Arthur', 'Ines', 'Gabriel', 'Laura', 'Mathieu',
+]
+
+VOIES = [
+    'Rue de la Paix', 'Avenue Victor Hugo', 'Boulevard Saint-Germain',
+    'Rue de Rivoli', 'Place Bellecour', 'Cours Mirabeau', 'Rue Nationale',
+    'Avenue de la République', 'Rue du Faubourg Saint-Antoine',
+    'Boulevard Haussmann', 'Cours Lafayette', 'Rue Saint-Antoine',
+]
+
+CLIENT_COLUMNS = ('id', 'nom', 'prenom', 'email', 'adresse', 'mot_de_passe',
+                  'date_creation', 'derniere_commande')
+FACTURE_COLUMNS = ('id', 'client_id', 'montant_ttc', 'date_facture', 'numero_facture')
+ARCHIVE_CLIENT_COLUMNS = ('id_anonyme', 'region_code', 'date_creation_mois',
+                          'derniere_commande_mois')
+ARCHIVE_FACTURE_COLUMNS = ('client_anonyme', 'montant_ttc', 'date_facture')
+
+# Schéma SQLite équivalent à setup_database.sql (index créés après chargement)
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS clients (
+    id INTEGER PRIMARY KEY,
+    nom TEXT NOT NULL,
+    prenom TEXT NOT NULL,
+    email TEXT UNIQUE NOT NULL,
+    adresse TEXT,
+    mot_de_passe TEXT NOT NULL,
+    date_creation TEXT DEFAULT CURRENT_TIMESTAMP,
+    derniere_commande TEXT
+);
+
+CREATE TABLE IF NOT EXISTS factures (
+    id INTEGER PRIMARY KEY,
+    client_id INTEGER NOT NULL REFERENCES clients(id) ON DELETE CASCADE,
+    montant_ttc REAL NOT NULL,
+    date_facture TEXT NOT NULL,
+    numero_facture TEXT UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS clients_anonymises (
+    id_anonyme TEXT PRIMARY KEY,
+    region_code TEXT,
+    date_creation_mois TEXT,
+    derniere_commande_mois TEXT,
+    date_anonymisation TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS factures_anonymisees (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    client_anonyme TEXT NOT NULL REFERENCES clients_anonymises(id_anonyme) ON DELETE CASCADE,
+    montant_ttc REAL NOT NULL,
+    date_facture TEXT NOT NULL,
+    date_archivage TEXT DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+SQLITE_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_derniere_commande ON clients (derniere_commande);
+CREATE INDEX IF NOT EXISTS idx_date_creation ON clients (date_creation);
+CREATE INDEX IF NOT EXISTS idx_date_facture ON factures (date_facture);
+CREATE INDEX IF NOT EXISTS idx_client_id ON factures (client_id);
+CREATE INDEX IF NOT EXISTS idx_creation_mois ON clients_anonymises (date_creation_mois);
+CREATE INDEX IF NOT EXISTS idx_commande_mois ON clients_anonymises (derniere_commande_mois);
+CREATE INDEX IF NOT EXISTS idx_arch_date_facture ON factures_anonymisees (date_facture);
+CREATE INDEX IF NOT EXISTS idx_client_anonyme ON factures_anonymisees (client_anonyme);
+"""
+
+
+def log_message(message):
+    """Affiche un message horodaté (même format que les scripts shell).
+
+    Les messages partent sur stderr : en mode --files-only, stdout ne contient
+    que le SQL, qui peut être envoyé directement au client mysql.
+    """
+    print(f"[{datetime.datetime.now():%Y-%m-%d %H:%M:%S}] {message}", file=sys.stderr, flush=True)
+
+
+def years_before(reference_date, years):
+    """Nombre de jours entre la date de référence et la même date N années plus tôt.
+
+    Même calcul que DATE_SUB(..., INTERVAL N YEAR) : un 29 février devient un 28.
+    """
+    try:
+        past = reference_date.replace(year=reference_date.year - years)
+    except ValueError:
+        past = reference_date.replace(year=reference_date.year - years, day=28)
+    return (reference_date - past).days
+
+
+def band_limits(reference_date):
+    """Bornes en jours de chaque tranche, alignées sur les requêtes des scripts.
+
+    Les jours-frontières sont exclus : selon l'heure, ils tomberaient d'un côté
+    ou de l'autre de DATE_SUB(NOW(), ...).
+    """
+    limits = []
+    for low, high in BANDS.values():
+        limits.append((years_before(reference_date, low) + 1,
+                       years_before(reference_date, high) - 1))
+    return limits
+
+
+def parse_weights(value):
+    """Convertit une répartition 'a,b,c' en trois poids positifs"""
+    try:
+        weights = [float(part) for part in value.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"répartition invalide: {value}")
+    if len(weights) != 3 or any(w < 0 for w in weights) or sum(weights) == 0:
+        raise argparse.ArgumentTypeError(
+            "la répartition attend 3 poids positifs (actifs,anonymiser,supprimer)")
+    return weights
+
+
+class Generator:
+    """Produit les lignes clients/factures sans objet datetime par ligne.
+
+    Les dates sont manipulées en jours relatifs à la date de référence puis
+    converties via des tables précalculées, ce qui permet de tenir plusieurs
+    millions de lignes par minute en Python pur.
+    """
+
+    def __init__(self, reference_date, weights, factures_moyenne, seed):
+        self.rng = random.Random(seed)
+        # Identifiant d'exécution volontairement hors graine : les id_anonyme d'une
+        # exécution ne peuvent pas recouvrir ceux d'une exécution précédente (même
+        # avec --seed, ils changent donc à chaque exécution)
+        self.run_id = secrets.token_hex(8)
+        self.factures_moyenne = max(1.0, factures_moyenne)
+
+        # Tables de correspondance jour -> chaîne (20 ans d'historique)
+        self.max_days = 20 * 365
+        self.days = [(reference_date - datetime.timedelta(days=d)).isoformat()
+                     for d in range(self.max_days + 1)]
+        self.months = [d[:8] + '01' for d in self.days]
+        self.years = [d[:4] for d in self.days]
+        self.times = [f" {m // 60:02d}:{m % 60:02d}:00" for m in range(24 * 60)]
+
+        # Pool d'empreintes SHA-256 (évite un hash par ligne)
+        self.passwords = [hashlib.sha256(f"password{i}".encode()).hexdigest()
+                          for i in range(1024)]
+
+        # Poids cumulés : random.choices() évite alors une somme par tirage
+        self.bands = band_limits(reference_date)
+        self.band_weights = list(weights)
+        self.band_cum = list(itertools.accumulate(weights))
+        self.cities = [(city, region) for city, region, _ in CITIES]
+        self.city_cum = list(itertools.accumulate(weight for _, _, weight in CITIES))
+
+    def _nb_factures(self):
+        """Nombre de factures par client (1 + loi exponentielle)"""
+        if self.factures_moyenne <= 1:
+            return 1
+        return 1 + int(self.rng.expovariate(1.0 / (self.factures_moyenne - 1)))
+
+    def _montant(self):
+        """Montant TTC réaliste (log-normale centrée autour de 200 €)"""
+        return f"{min(9999.99, max(5.0, self.rng.lognormvariate(5.2, 0.5))):.2f}"
+
+    def _client_dates(self):
+        """Retourne (jour_derniere_commande, jour_creation) en jours passés"""
+        rng = self.rng
+        low, high = rng.choices(self.bands, cum_weights=self.band_cum)[0]
+        last = rng.randint(low, high)
+        created = min(self.max_days, last + rng.randint(0, 5 * 365))
+        return last, created
+
+    def _facture_days(self, last, created, count):
+        """Jours des factures : la plus récente coïncide avec la dernière commande"""
+        rng = self.rng
+        return [last] + [rng.randint(last, created) for _ in range(count - 1)]
+
+    def production(self, count, client_start, facture_start):
+        """Génère (client, [factures]) pour rgpd_production"""
+        rng = self.rng
+        facture_id = facture_start
+        for client_id in range(client_start, client_start + count):
+            last, created = self._client_dates()
+            city, _ = rng.choices(self.cities, cum_weights=self.city_cum)[0]
+            nom = rng.choice(NOMS)
+            prenom = rng.choice(PRENOMS)
+            client = (
+                str(client_id),
+                nom,
+                prenom,
+                f"{prenom.lower()}.{nom.lower()}.{client_id}@email.com",
+                f"{rng.randint(1, 999)} {rng.choice(VOIES)}, {city}",
+                rng.choice(self.passwords),
+                self.days[created] + rng.choice(self.times),
+                self.days[last] + rng.choice(self.times),
+            )
+            factures = []
+            for day in self._facture_days(last, created, self._nb_factures()):
+                factures.append((
+                    str(facture_id),
+                    str(client_id),
+                    self._montant(),
+                    self.days[day],
+                    f"F{self.years[day]}-G{facture_id}",
+                ))
+                facture_id += 1
+            yield client, factures
+
+    def archive(self, count):
+        """Génère (client_anonymise, [factures_anonymisees]) pour rgpd_archive"""
+        rng = self.rng
+        # L'archive ne contient que des clients de plus de 3 ans
+        bands = self.bands[1:]
+        weights = self.band_weights[1:] if sum(self.band_weights[1:]) else [1, 1]
+        for i in range(count):
+            low, high = rng.choices(bands, weights)[0]
+            last = rng.randint(low, high)
+            created = min(self.max_days, last + rng.randint(0, 5 * 365))
+            _, region = rng.choices(self.cities, cum_weights=self.city_cum)[0]
+            id_anonyme = hashlib.sha256(f"synthetique-{self.run_id}-{i}".encode()).hexdigest()
+            client = (id_anonyme, region, self.months[created], self.months[last])
+            factures = [(id_anonyme, self._montant(), self.days[day])
+                        for day in self._facture_days(last, created, self._nb_factures())]
+            yield client, factures
+
+
+def batched(rows, size):
+    """Regroupe un itérable (client, factures) en lots de taille fixe"""
+    clients, factures = [], []
+    for client, client_factures in rows:
+        clients.append(client)
+        factures.extend(client_factures)
+        if len(clients) >= size:
+            yield clients, factures
+            clients, factures = [], []
+    if clients:
+        yield clients, factures
+
+
+# ---------------------------------------------------------------------------
+# Cible MySQL : fichiers TSV + LOAD DATA LOCAL INFILE
+# ---------------------------------------------------------------------------
+
+def mysql_execute(database, query, local_infile=False):
+    """Exécute une requête via le client mysql et retourne la sortie brute"""
+    command = ['mysql', '-u', DB_USER, f'-p{DB_PASS}', '-N', '-B', database, '-e', query]
+    if local_infile:
+        command.insert(1, '--local-infile=1')
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"échec mysql sur {database}")
+    return result.stdout
+
+
+def mysql_max_id(database, table, column='id'):
+    """Dernier identifiant utilisé, pour ajouter des lignes sans collision"""
+    output = mysql_execute(database, f"SELECT COALESCE(MAX({column}), 0) FROM {table}")
+    return int(output.strip().splitlines()[-1])
+
+
+def write_tsv(path, rows):
+    """Écrit un lot de lignes au format attendu par LOAD DATA (tabulations)"""
+    with open(path, 'a', encoding='utf-8') as handle:
+        handle.writelines('\t'.join(row) + '\n' for row in rows)
+
+
+def load_data_statement(path, table, columns):
+    """Instruction LOAD DATA LOCAL INFILE pour un fichier TSV"""
+    return (f"LOAD DATA LOCAL INFILE '{os.path.abspath(path)}' INTO TABLE {table} "
+            f"CHARACTER SET utf8mb4 FIELDS TERMINATED BY '\\t' "
+            f"LINES TERMINATED BY '\\n' ({', '.join(columns)});")
+
+
+def bulk_load_sql(statements):
+    """Encadre les LOAD DATA des réglages de chargement en masse"""
+    return ("SET foreign_key_checks = 0; SET unique_checks = 0; SET autocommit = 0; "
+            + ' '.join(statements)
+            + " COMMIT; SET unique_checks = 1; SET foreign_key_checks = 1;")
+
+
+def run_mysql(args, generator):
+    """Génère les fichiers TSV puis les charge dans MySQL"""
+    os.makedirs(args.output_dir, exist_ok=True)
+    files = {name: os.path.join(args.output_dir, f"{name}.tsv")
+             for name in ('clients', 'factures', 'clients_anonymises', 'factures_anonymisees')}
+    for path in files.values():
+        if os.path.exists(path):
+            os.remove(path)
+
+    if args.files_only:
+        client_start, facture_start = args.start_id, args.start_id
+    else:
+        client_start = mysql_max_id(DB_PROD, 'clients') + 1
+        facture_start = mysql_max_id(DB_PROD, 'factures') + 1
+
+    totals = {'clients': 0, 'factures': 0, 'clients_anonymises': 0, 'factures_anonymisees': 0}
+
+    rows = generator.production(args.clients, client_start, facture_start)
+    for clients, factures in batched(rows, args.batch_size):
+        write_tsv(files['clients'], clients)
+        write_tsv(files['factures'], factures)
+        totals['clients'] += len(clients)
+        totals['factures'] += len(factures)
+        log_message(f"Production: {totals['clients']} clients, {totals['factures']} factures générés")
+
+    for clients, factures in batched(generator.archive(args.archive), args.batch_size):
+        write_tsv(files['clients_anonymises'], clients)
+        write_tsv(files['factures_anonymisees'], factures)
+        totals['clients_anonymises'] += len(clients)
+        totals['factures_anonymisees'] += len(factures)
+        log_message(f"Archive: {totals['clients_anonymises']} clients anonymisés générés")
+
+    prod_sql = bulk_load_sql([
+        load_data_statement(files['clients'], 'clients', CLIENT_COLUMNS),
+        load_data_statement(files['factures'], 'factures', FACTURE_COLUMNS),
+    ])
+    archive_sql = bulk_load_sql([
+        load_data_statement(files['clients_anonymises'], 'clients_anonymises', ARCHIVE_CLIENT_COLUMNS),
+        load_data_statement(files['factures_anonymisees'], 'factures_anonymisees', ARCHIVE_FACTURE_COLUMNS),
+    ])
+
+    if args.files_only:
+        log_message(f"Fichiers TSV écrits dans {args.output_dir}")
+        print(f"USE {DB_PROD};\n{prod_sql}")
+        if args.archive:
+            print(f"USE {DB_ARCHIVE};\n{archive_sql}")
+        return totals
+
+    log_message(f"Chargement LOAD DATA dans {DB_PROD}...")
+    mysql_execute(DB_PROD, prod_sql, local_infile=True)
+    if args.archive:
+        log_message(f"Chargement LOAD DATA dans {DB_ARCHIVE}...")
+        mysql_execute(DB_ARCHIVE, archive_sql, local_infile=True)
+
+    if not args.keep_files:
+        for path in files.values():
+            if os.path.exists(path):
+                os.remove(path)
+    return totals
+
+
+# ---------------------------------------------------------------------------
+# Cible SQLite : insertions groupées
+# ---------------------------------------------------------------------------
+
+def run_sqlite(args, generator):
+    """Alimente une base SQLite locale par lots (executemany)"""
+    connection = sqlite3.connect(args.sqlite_db, isolation_level=None)
+    # Réglages de chargement en masse : pas de journal ni de fsync
+    connection.execute('PRAGMA journal_mode = OFF')
+    connection.execute('PRAGMA synchronous = OFF')
+    connection.execute('PRAGMA cache_size = -262144')
+    connection.execute('PRAGMA temp_store = MEMORY')
+    connection.executescript(SQLITE_SCHEMA)
+
+    client_start = connection.execute('SELECT COALESCE(MAX(id), 0) FROM clients').fetchone()[0] + 1
+    facture_start = connection.execute('SELECT COALESCE(MAX(id), 0) FROM factures').fetchone()[0] + 1
+
+    client_sql = f"INSERT INTO clients ({', '.join(CLIENT_COLUMNS)}) VALUES ({', '.join('?' * len(CLIENT_COLUMNS))})"
+    facture_sql = f"INSERT INTO factures ({', '.join(FACTURE_COLUMNS)}) VALUES ({', '.join('?' * len(FACTURE_COLUMNS))})"
+    arch_client_sql = (f"INSERT INTO clients_anonymises ({', '.join(ARCHIVE_CLIENT_COLUMNS)}) "
+                       f"VALUES ({', '.join('?' * len(ARCHIVE_CLIENT_COLUMNS))})")
+    arch_facture_sql = (f"INSERT INTO factures_anonymisees ({', '.join(ARCHIVE_FACTURE_COLUMNS)}) "
+                        f"VALUES ({', '.join('?' * len(ARCHIVE_FACTURE_COLUMNS))})")
+
+    totals = {'clients': 0, 'factures': 0, 'clients_anonymises': 0, 'factures_anonymisees': 0}
+
+    connection.execute('BEGIN')
+    rows = generator.production(args.clients, client_start, facture_start)
+    for clients, factures in batched(rows, args.batch_size):
+        connection.executemany(client_sql, clients)
+        connection.executemany(facture_sql, factures)
+        totals['clients'] += len(clients)
+        totals['factures'] += len(factures)
+        log_message(f"Production: {totals['clients']} clients, {totals['factures']} factures insérés")
+
+    for clients, factures in batched(generator.archive(args.archive), args.batch_size):
+        connection.executemany(arch_client_sql, clients)
+        connection.executemany(arch_facture_sql, factures)
+        totals['clients_anonymises'] += len(clients)
+        totals['factures_anonymisees'] += len(factures)
+        log_message(f"Archive: {totals['clients_anonymises']} clients anonymisés insérés")
+    connection.execute('COMMIT')
+
+    log_message("Création des index...")
+    connection.executescript(SQLITE_INDEXES)
+    connection.close()
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Génère un jeu de données RGPD synthétique à l'échelle de la production")
+    parser.add_argument('--clients', type=int, default=100000,
+                        help="nombre de clients en production (défaut: 100000)")
+    parser.add_argument('--factures-moyenne', type=float, default=8.0,
+                        help="nombre moyen de factures par client (défaut: 8)")
+    parser.add_argument('--archive', type=int, default=0,
+                        help="nombre de clients anonymisés à générer dans l'archive (défaut: 0)")
+    parser.add_argument('--repartition', type=parse_weights, default=[60, 30, 10],
+                        metavar='A,B,C',
+                        help="poids des tranches <3 ans, 3-10 ans, >10 ans (défaut: 60,30,10)")
+    parser.add_argument('--target', choices=('mysql', 'sqlite'), default='sqlite',
+                        help="cible de chargement (défaut: sqlite)")
+    parser.add_argument('--sqlite-db', default='rgpd.sqlite',
+                        help="fichier SQLite pour la cible sqlite (défaut: rgpd.sqlite)")
+    parser.add_argument('--output-dir', default='/tmp/rgpd_dataset',
+                        help="répertoire des fichiers TSV pour la cible mysql")
+    parser.add_argument('--files-only', action='store_true',
+                        help="mysql: écrire les TSV et afficher les LOAD DATA sans les exécuter")
+    parser.add_argument('--start-id', type=int, default=None,
+                        help="mysql --files-only (obligatoire): premier identifiant client/facture, "
+                             "supérieur au MAX(id) de clients et de factures")
+    parser.add_argument('--keep-files', action='store_true',
+                        help="mysql: conserver les fichiers TSV après chargement")
+    parser.add_argument('--batch-size', type=int, default=50000,
+                        help="clients par lot d'écriture (défaut: 50000)")
+    parser.add_argument('--reference-date', type=datetime.date.fromisoformat,
+                        default=datetime.date.today(),
+                        help="date servant de référence aux tranches (défaut: aujourd'hui)")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="graine aléatoire pour un jeu reproductible "
+                             "(hors id_anonyme de l'archive, uniques à chaque exécution)")
+    args = parser.parse_args()
+
+    if args.clients < 0 or args.archive < 0 or args.batch_size <= 0:
+        parser.error("--clients, --archive et --batch-size doivent être positifs")
+    # Sans accès à la base, --files-only ne peut pas lire MAX(id) : un identifiant
+    # de départ par défaut écraserait silencieusement (LOAD DATA LOCAL = IGNORE)
+    # les lignes existantes
+    if args.files_only and args.start_id is None:
+        parser.error("--files-only nécessite --start-id (supérieur au MAX(id) de clients et factures)")
+    if args.start_id is not None and not args.files_only:
+        parser.error("--start-id n'est utilisé qu'avec --files-only (sinon MAX(id) + 1)")
+    if args.start_id is not None and args.start_id < 1:
+        parser.error("--start-id doit être strictement positif")
+
+    log_message("=== GÉNÉRATION DE DONNÉES SYNTHÉTIQUES RGPD ===")
+    log_message(f"Cible: {args.target} - {args.clients} clients, archive: {args.archive}")
+
+    generator = Generator(args.reference_date, args.repartition, args.factures_moyenne, args.seed)
+    start = time.monotonic()
+    try:
+        if args.target == 'mysql':
+            totals = run_mysql(args, generator)
+        else:
+            totals = run_sqlite(args, generator)
+    except (RuntimeError, OSError, sqlite3.Error) as error:
+        log_message(f"ERREUR: {error}")
+        return 1
+
+    elapsed = time.monotonic() - start
+    total_rows = sum(totals.values())
+    log_message("=== STATISTIQUES ===")
+    for table, count in totals.items():
+        log_message(f"{table}: {count}")
+    log_message(f"Durée: {elapsed:.1f}s ({total_rows / max(elapsed, 1e-9):.0f} lignes/s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,15 +7,53 @@ Auteur: Système automatisé
 Description: Site web avec authentification et zone privée
 """
 
-from flask import Flask, render_template_string, request, session, redirect, url_for, jsonify, flash
+import time
+
+# Instant zéro du démarrage (avant l'import de Flask, le plus coûteux)
+STARTUP_T0 = time.monotonic()
+
+from flask import Flask, render_template, render_template_string, request, session, redirect, url_for, jsonify, flash, abort
 import logging
 import os
 import hashlib
 import datetime
+import socket
+import threading
+from contextlib import contextmanager
 from functools import wraps
 import secrets
 
-app = Flask(__name__)
+# Profil de démarrage : durée de chaque phase et délais jusqu'à disponibilité
+STARTUP_PROFILE = {
+    'phases': [],
+    'ready_ms': None,
+    'first_request_ms': None,
+}
+
+def elapsed_since_start_ms():
+    """Millisecondes écoulées depuis le début de l'import du module"""
+    return round((time.monotonic() - STARTUP_T0) * 1000, 2)
+
+@contextmanager
+def startup_phase(name, deferred=False):
+    """Mesure la durée d'une phase d'initialisation pour le profil de démarrage"""
+    start = time.monotonic()
+    yield
+    # Phase enregistrée seulement si elle a abouti (pas de doublon en cas d'échec)
+    STARTUP_PROFILE['phases'].append({
+        'phase': name,
+        'ms': round((time.monotonic() - start) * 1000, 2),
+        'deferred': deferred,
+    })
+
+STARTUP_PROFILE['phases'].append({'phase': 'imports', 'ms': elapsed_since_start_ms(), 'deferred': False})
+
+# Mode initialisation paresseuse : la configuration non critique (comptes,
+# templates) est reportée à la première requête
+LAZY_INIT = os.environ.get('WEBAPP_LAZY_INIT') == '1'
+
+with startup_phase('flask_app'):
+    app = Flask(__name__)
 
 # Configuration sécurisée
 app.config['SECRET_KEY'] = secrets.token_hex(32)
@@ -26,38 +64,42 @@ app.config['PERMANENT_SESSION_LIFETIME'] = datetime.timedelta(hours=1)
 
 # Configuration des logs
 LOG_DIR = '/var/log/webapp'
-os.makedirs(LOG_DIR, exist_ok=True)
-
-# Configuration du logging pour fail2ban
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(f'{LOG_DIR}/app.log'),
-        logging.StreamHandler()
-    ]
-)
 
 logger = logging.getLogger(__name__)
 
-# Base de données des utilisateurs (en dur pour la démonstration)
-USERS = {
-    'admin': {
-        'password': hashlib.sha256('admin123'.encode()).hexdigest(),
-        'role': 'administrator',
-        'name': 'Administrateur'
-    },
-    'user': {
-        'password': hashlib.sha256('password'.encode()).hexdigest(),
-        'role': 'user',
-        'name': 'Utilisateur Standard'
-    },
-    'test': {
-        'password': hashlib.sha256('test123'.encode()).hexdigest(),
-        'role': 'tester',
-        'name': 'Utilisateur Test'
+def init_logging():
+    """Configuration du logging pour fail2ban"""
+    os.makedirs(LOG_DIR, exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(f'{LOG_DIR}/app.log'),
+            logging.StreamHandler()
+        ]
+    )
+
+def load_users():
+    """Base de données des utilisateurs (en dur pour la démonstration)"""
+    return {
+        'admin': {
+            'password': hashlib.sha256('admin123'.encode()).hexdigest(),
+            'role': 'administrator',
+            'name': 'Administrateur'
+        },
+        'user': {
+            'password': hashlib.sha256('password'.encode()).hexdigest(),
+            'role': 'user',
+            'name': 'Utilisateur Standard'
+        },
+        'test': {
+            'password': hashlib.sha256('test123'.encode()).hexdigest(),
+            'role': 'tester',
+            'name': 'Utilisateur Test'
+        }
     }
-}
+
+USERS = {}
 
 # Templates HTML intégrés
 HOME_TEMPLATE = """
@@ -499,6 +541,86 @@ PRIVATE_TEMPLATE = """
 </html>
 """
 
+# Templates compilés une seule fois (render_template_string recompile à chaque appel)
+TEMPLATES = {}
+
+def compile_templates():
+    """Compile les templates intégrés dans l'environnement Jinja de l'application"""
+    for name, source in (('home', HOME_TEMPLATE), ('login', LOGIN_TEMPLATE), ('private', PRIVATE_TEMPLATE)):
+        TEMPLATES[name] = app.jinja_env.from_string(source)
+
+_initialized = False
+_init_lock = threading.Lock()
+
+def initialize():
+    """Initialisation non critique : comptes et templates.
+
+    Exécutée à l'import en mode normal, ou à la première requête lorsque
+    WEBAPP_LAZY_INIT=1. Les appels suivants ne font rien.
+    """
+    global _initialized
+    if _initialized:
+        return
+    with _init_lock:
+        if _initialized:
+            return
+        # Étapes déjà faites ignorées : une nouvelle tentative ne les remesure pas
+        if not USERS:
+            with startup_phase('users', deferred=LAZY_INIT):
+                USERS.update(load_users())
+        if not TEMPLATES:
+            with startup_phase('templates', deferred=LAZY_INIT):
+                compile_templates()
+        _initialized = True
+
+def startup_report():
+    """Résumé du profil de démarrage sur une ligne (pour les logs)"""
+    phases = ', '.join(
+        f"{p['phase']}{' (différé)' if p['deferred'] else ''}={p['ms']}ms"
+        for p in STARTUP_PROFILE['phases']
+    )
+    ready = STARTUP_PROFILE['ready_ms']
+    ready = 'n/a' if ready is None else f"{ready}ms"  # Import ou mode debug : pas de make_server
+    return (f"Startup profile: lazy_init={LAZY_INIT}, ready={ready}, "
+            f"first_request={STARTUP_PROFILE['first_request_ms']}ms - {phases}")
+
+def sd_notify(message):
+    """Envoie une notification à systemd (Type=notify) sans dépendance externe"""
+    address = os.environ.get('NOTIFY_SOCKET')
+    if not address:
+        return False
+    if address.startswith('@'):
+        address = '\0' + address[1:]  # Socket abstrait Linux
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.connect(address)
+            sock.sendall(message.encode())
+    except OSError as e:
+        logger.warning(f"systemd notification failed: {e}")
+        return False
+    return True
+
+# Les logs (répertoire, FileHandler) peuvent échouer : ils sont toujours configurés
+# au démarrage, avant READY=1, pour qu'une erreur fasse redémarrer le service
+with startup_phase('logging'):
+    init_logging()
+
+if not LAZY_INIT:
+    initialize()
+
+@app.before_request
+def ensure_initialized():
+    """Termine l'initialisation différée avant de servir la première requête"""
+    initialize()
+
+@app.after_request
+def record_first_request(response):
+    """Mesure le délai jusqu'à la première requête servie"""
+    if STARTUP_PROFILE['first_request_ms'] is None:
+        STARTUP_PROFILE['first_request_ms'] = elapsed_since_start_ms()
+        logger.info(startup_report())
+    return response
+
 def login_required(f):
     """Décorateur pour protéger les routes nécessitant une authentification"""
     @wraps(f)
@@ -523,8 +645,8 @@ def get_client_ip():
 def home():
     """Page d'accueil publique"""
     logger.info(f"Access to home page from {get_client_ip()}")
-    return render_template_string(HOME_TEMPLATE, 
-                                current_time=datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    return render_template(TEMPLATES['home'],
+                           current_time=datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
 
 @app.route('/login', methods=['GET', 'POST'])
 def login():
@@ -538,7 +660,7 @@ def login():
         if not username or not password:
             logger.warning(f"Login attempt with empty credentials from {client_ip}")
             flash('Nom d\'utilisateur et mot de passe requis.')
-            return render_template_string(LOGIN_TEMPLATE)
+            return render_template(TEMPLATES['login'])
         
         # Vérification des credentials
         if username in USERS:
@@ -563,7 +685,7 @@ def login():
         logger.warning(f"Failed login attempt for user '{username}' from {client_ip}")
         flash('Nom d\'utilisateur ou mot de passe incorrect.')
         
-    return render_template_string(LOGIN_TEMPLATE)
+    return render_template(TEMPLATES['login'])
 
 @app.route('/private')
 @login_required
@@ -575,10 +697,10 @@ def private():
     # Simulation du compteur de sessions (normalement en base de données)
     session_count = 1
     
-    return render_template_string(PRIVATE_TEMPLATE,
-                                user_ip=client_ip,
-                                session_count=session_count,
-                                current_time=datetime.datetime.now())
+    return render_template(TEMPLATES['private'],
+                           user_ip=client_ip,
+                           session_count=session_count,
+                           current_time=datetime.datetime.now())
 
 @app.route('/logout')
 def logout():
@@ -610,6 +732,23 @@ def health_check():
         'timestamp': datetime.datetime.now().isoformat()
     })
 
+@app.route('/api/startup')
+def api_startup():
+    """Profil de démarrage : phases d'initialisation et délais de disponibilité"""
+    # Diagnostic interne : uniquement en local, jamais via Caddy (qui ajoute
+    # X-Forwarded-For / X-Real-IP à chaque requête relayée)
+    if (request.remote_addr not in ('127.0.0.1', '::1')
+            or request.headers.get('X-Forwarded-For')
+            or request.headers.get('X-Real-IP')):
+        abort(404)
+    return jsonify({
+        'lazy_init': LAZY_INIT,
+        'phases': STARTUP_PROFILE['phases'],
+        'ready_ms': STARTUP_PROFILE['ready_ms'],
+        'first_request_ms': STARTUP_PROFILE['first_request_ms'],
+        'uptime_ms': elapsed_since_start_ms()
+    })
+
 # Gestionnaire d'erreur personnalisé
 @app.errorhandler(404)
 def page_not_found(e):
@@ -660,18 +799,29 @@ def internal_error(e):
 if __name__ == '__main__':
     logger.info("Starting Flask application...")
     
-    # Création du répertoire de logs si nécessaire
-    os.makedirs(LOG_DIR, exist_ok=True)
-    
     # Mode debug uniquement en développement
     debug_mode = os.environ.get('FLASK_ENV') == 'development'
     
     # Port configuré par variable d'environnement ou 5000 par défaut
     port = int(os.environ.get('PORT', 5000))
     
-    app.run(
-        host='127.0.0.1',  # Écoute seulement en local (reverse proxy)
-        port=port,
-        debug=debug_mode,
-        threaded=True
-    )
\ No newline at end of file
+    if debug_mode:
+        # Mode développement (rechargement automatique) : READY=1 est envoyé par le
+        # processus principal avant app.run, sans attendre l'ouverture du socket
+        if not os.environ.get('WERKZEUG_RUN_MAIN'):
+            sd_notify("READY=1\nSTATUS=Development server (debug)")
+        app.run(
+            host='127.0.0.1',  # Écoute seulement en local (reverse proxy)
+            port=port,
+            debug=debug_mode,
+            threaded=True
+        )
+    else:
+        from werkzeug.serving import make_server
+
+        # Le socket est ouvert ici : à partir de ce point l'application peut servir
+        server = make_server('127.0.0.1', port, app, threaded=True)
+        STARTUP_PROFILE['ready_ms'] = elapsed_since_start_ms()
+        sd_notify(f"READY=1\nSTATUS=Listening on 127.0.0.1:{port}")
+        logger.info(f"Ready to serve on 127.0.0.1:{port} after {STARTUP_PROFILE['ready_ms']}ms")
+        server.serve_forever()